@@ -1,15 +1,22 @@
 # Core dependencies
 # The `__future__` import must be listed first. Otherwise, a `SyntaxError` is emitted.
 from __future__ import annotations
-from abc import ABC, abstractmethod
+from abc import ABC
 import asyncio
-from enum import Enum, auto
+from collections import deque
+from enum import IntEnum, auto
 from typing import override
 
 # Package dependencies
 from PySide6.QtCore import Signal
 
 
+class ControllerMessage(IntEnum):
+    START_CAMERA_EXPOSURE = auto()
+    STOP_CAMERA_EXPOSURE = auto()
+    ABORT_CAMERA_EXPOSURE = auto()
+
+
 class Controller:
     def __init__(self, initial_state: IState, signals: list[Signal]) -> None:
         """Initialize the controller to the given initial state and call the `
@@ -17,55 +24,56 @@ class Controller:
         """
         self.__signals = signals
         self.__state = initial_state
-        self.__state.controller = self
-        self.__state.signals = signals
+        self.__state._controller = self
+        self.__state._signals = signals
         self.__state.on_entry()
 
     def _transition_to(self, new_state: IState) -> None:
         """Transition from the current state to the given new state. This calls
         the `on_exit` method on the current state and the `on_entry` of the
         new state. This method should not be called by any object other than
-        concrete implementations of `IState`.
+        the controller itself and concrete implementations of `IState`.
         """
         self.__state.on_exit()
+        new_state._controller = self
+        new_state._signals = self.__signals
         self.__state = new_state
-        self.__state.controller = self
-        self.__state.signals = self.__signals
-        self.__state.on_entry()
+        new_state.on_entry()
 
     @property
     def state(self):
         """Get the current state"""
         return self.__state
 
+    def handle_message(self, message: ControllerMessage) -> None:
+        """Transition to the state that the current state transitions to for the message, if
+        any. A message that is not valid in the current state is ignored.
+        """
+        new_state = _TRANSITIONS.get((self.__state, message))
+        if new_state is not None:
+            self._transition_to(new_state)
+
     def start_camera_exposure(self) -> None:
-        self.__state.start_camera_exposure()
+        self.handle_message(ControllerMessage.START_CAMERA_EXPOSURE)
 
     def stop_camera_exposure(self) -> None:
-        self.__state.stop_camera_exposure()
+        self.handle_message(ControllerMessage.STOP_CAMERA_EXPOSURE)
 
     def abort_camera_exposure(self) -> None:
-        self.__state.abort_camera_exposure()
+        self.handle_message(ControllerMessage.ABORT_CAMERA_EXPOSURE)
 
 
 class IState(ABC):
-    """Serve as an interface between the controller and the explicit, individual states."""
-
-    @property
-    def controller(self) -> Controller:
-        return self.__controller
+    """Serve as an interface between the controller and the explicit, individual states.
+    The controller sets a state's `_controller` and `_signals` attributes directly when it
+    transitions to the state, so they are plain slots rather than properties. Which state each
+    message transitions a state to is not up to the state but is listed in `_TRANSITIONS`.
+    """
 
-    @controller.setter
-    def controller(self, controller: Controller) -> None:
-        self.__controller = controller
+    __slots__ = ("_controller", "_signals")
 
-    @property
-    def signals(self) -> list[Signal]:
-        return self.__signals
-
-    @signals.setter
-    def signals(self, signals: list[Signal]):
-        self.__signals = signals
+    _controller: Controller
+    _signals: list[Signal]
 
     def on_entry(self) -> None:
         """Can be overridden by a state to perform an action when the state is
@@ -79,114 +87,108 @@ class IState(ABC):
         """
         pass
 
-    # If a concrete implementation does not handle the called method, i.e., it is an invalid action
-    # in the specific state, it is enough to simply call `pass`.
-
-    @abstractmethod
-    def start_camera_exposure(self) -> None: ...
-
-    @abstractmethod
-    def stop_camera_exposure(self) -> None: ...
-
-    @abstractmethod
-    def abort_camera_exposure(self) -> None: ...
-
 
 class Idle(IState):
+    __slots__ = ()
+
     @override
     def on_entry(self):
-        self.signals[0].emit()
+        self._signals[0].emit()
         print("Idling ...")
 
-    def start_camera_exposure(self) -> None:
-        self.controller._transition_to(CameraExposing())
-
-    def stop_camera_exposure(self) -> None:
-        pass
-
-    def abort_camera_exposure(self) -> None:
-        pass
-
 
 class CameraExposing(IState):
+    __slots__ = ()
+
     @override
     def on_entry(self) -> None:
-        self.signals[1].emit()
+        self._signals[1].emit()
         print("Starting camera exposure ...")
 
     @override
     def on_exit(self) -> None:
         print("Stopping camera exposure ...")
 
-    def start_camera_exposure(self) -> None:
-        pass
-
-    def stop_camera_exposure(self) -> None:
-        self.controller._transition_to(SavingCameraImages())
-
-    def abort_camera_exposure(self) -> None:
-        self.controller._transition_to(AbortingCameraExposure())
-
 
 class SavingCameraImages(IState):
+    __slots__ = ()
+
     @override
     def on_entry(self) -> None:
-        self.signals[2].emit()
+        self._signals[2].emit()
         print("Saving camera images ...")
-        self.controller._transition_to(Idle())
-
-    def start_camera_exposure(self) -> None:
-        pass
-
-    def stop_camera_exposure(self) -> None:
-        pass
-
-    def abort_camera_exposure(self) -> None:
-        pass
+        self._controller._transition_to(IDLE)
 
 
 class AbortingCameraExposure(IState):
+    __slots__ = ()
+
     @override
     def on_entry(self) -> None:
-        self.signals[3].emit()
+        self._signals[3].emit()
         print("Aborting camera exposure ...")
-        self.controller._transition_to(Idle())
+        self._controller._transition_to(IDLE)
 
-    def start_camera_exposure(self) -> None:
-        pass
 
-    def stop_camera_exposure(self) -> None:
-        pass
+# The states hold nothing but the controller and signals, which the controller sets on every
+# transition, so a single instance of each state is shared rather than creating a new one for
+# every transition
+IDLE = Idle()
+EXPOSING = CameraExposing()
+SAVING = SavingCameraImages()
+ABORTING = AbortingCameraExposure()
 
-    def abort_camera_exposure(self) -> None:
-        pass
+# The state that each state transitions to for each message, which replaces a method per message
+# on every state. A message that is missing for a state is not valid in that state and is ignored.
+# Saving camera images and aborting a camera exposure are not listed, since those states
+# transition back to idling as soon as they are entered.
+_TRANSITIONS: dict[tuple[IState, ControllerMessage], IState] = {
+    (IDLE, ControllerMessage.START_CAMERA_EXPOSURE): EXPOSING,
+    (EXPOSING, ControllerMessage.STOP_CAMERA_EXPOSURE): SAVING,
+    (EXPOSING, ControllerMessage.ABORT_CAMERA_EXPOSURE): ABORTING,
+}
 
 
 if __name__ == "__main__":
-    controller = Controller(Idle())
+    controller = Controller(IDLE)
     controller.start_camera_exposure()
     controller.stop_camera_exposure()
 
 
-class ControllerMessage(Enum):
-    START_CAMERA_EXPOSURE = auto()
-    STOP_CAMERA_EXPOSURE = auto()
-    ABORT_CAMERA_EXPOSURE = auto()
+class ControllerInbox:
+    """An inbox of `ControllerMessage`s with a single sender and a single reader, which are both
+    on the same event loop. The messages are kept in a `collections.deque` and the reader waits on
+    an `asyncio.Event` when the inbox is empty, which avoids the waiter bookkeeping that an
+    `asyncio.Queue` does for any number of readers and writers.
+    """
 
+    __slots__ = ("__messages", "__message_sent")
 
-async def send_controller_message(inbox: asyncio.Queue, message: ControllerMessage):
-    inbox.put_nowait(message)
+    def __init__(self) -> None:
+        self.__messages: deque[ControllerMessage] = deque()
+        self.__message_sent = asyncio.Event()
 
+    def send(self, message: ControllerMessage) -> None:
+        """Send a message to the inbox and wake up the reader if it is waiting"""
+        self.__messages.append(message)
+        self.__message_sent.set()
 
-async def read_controller_inbox(inbox: asyncio.Queue, controller: Controller):
-    message = await inbox.get()
+    async def read(self) -> ControllerMessage:
+        """Block until a message is in the inbox and then return the oldest message"""
+        while not self.__messages:
+            self.__message_sent.clear()
+            await self.__message_sent.wait()
+        return self.__messages.popleft()
 
-    match message:
-        case ControllerMessage.START_CAMERA_EXPOSURE:
-            controller.start_camera_exposure()
+    def read_available(self) -> list[ControllerMessage]:
+        """Read all of the messages that are currently in the inbox without blocking, in the
+        order they were sent
+        """
+        messages = list(self.__messages)
+        self.__messages.clear()
+        return messages
 
-        case ControllerMessage.STOP_CAMERA_EXPOSURE:
-            controller.stop_camera_exposure()
 
-        case ControllerMessage.ABORT_CAMERA_EXPOSURE:
-            controller.abort_camera_exposure()
+async def read_controller_inbox(inbox: ControllerInbox, controller: Controller):
+    message = await inbox.read()
+    controller.handle_message(message)
@@ -4,8 +4,8 @@ the state machine that is implemented here using Qt's State Machine framework.
 
 # Core dependencies
 import asyncio
+from itertools import groupby
 import sys
-from threading import Thread
 
 # Package dependencies
 from PySide6.QtCore import Signal
@@ -18,9 +18,10 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QVBoxLayout,
 )
+import qasync
 
 # Project dependencies
-from controller import Controller, ControllerMessage, send_controller_message, Idle
+from controller import IDLE, Controller, ControllerInbox, ControllerMessage
 from led_indicator import LedIndicator
 
 
@@ -35,12 +36,10 @@ class MainWindow(QWidget):
     def __init__(self) -> None:
         super().__init__()
 
-        # The the `asyncio` queue and event loop are created here, in the GUI thread (main thread),
-        # but they will be passed into a new thread that will actually run the event loop.
-        # Under no circumstances should the `asyncio.Queue` be used outside of that event loop. It
-        # is only okay to construct it outside of the event loop.
-        self._asyncio_queue = asyncio.Queue()
-        self._asyncio_event_loop = asyncio.new_event_loop()
+        # The controller's inbox is created here, in the GUI thread (main thread), which is also the
+        # thread that runs the `asyncio` event loop since `qasync` runs the event loop on top of
+        # Qt's event loop. Thus, the `ControllerInbox` can be used directly by the GUI.
+        self._controller_inbox = ControllerInbox()
 
         # Create the state machine and the various states
         self.state_machine = QStateMachine(parent=self)
@@ -159,52 +158,44 @@ class MainWindow(QWidget):
         self.show()
 
     def send_controller_message(self, message: ControllerMessage) -> None:
-        """Send the `asyncio` event loop's `asyncio.Queue` a message by using the coroutine
-        `send_controller_message` and sending it to run on the `asyncio` event loop, putting
-        the message on the `asyncio.Queue`.
+        """Send the `asyncio` event loop's `ControllerInbox` a message by sending the message
+        directly to the `ControllerInbox`. This is safe because the `asyncio` event loop runs
+        on the GUI thread.
         """
-        asyncio.run_coroutine_threadsafe(
-            coro=send_controller_message(inbox=self._asyncio_queue, message=message),
-            loop=self._asyncio_event_loop,
-        )
+        self._controller_inbox.send(message)
 
 
-async def read_inbox(queue: asyncio.Queue, controller: Controller):
-    while True:
-        message = await queue.get()
-        match message:
-            case ControllerMessage.START_CAMERA_EXPOSURE:
-                await asyncio.to_thread(controller.start_camera_exposure)
-
-            case ControllerMessage.STOP_CAMERA_EXPOSURE:
-                await asyncio.to_thread(controller.stop_camera_exposure)
-
-            case ControllerMessage.ABORT_CAMERA_EXPOSURE:
-                await asyncio.to_thread(controller.abort_camera_exposure)
-
-
-async def asyncio_main(inbox: asyncio.Queue, signals: list[Signal]):
-    controller = await asyncio.to_thread(Controller, Idle(), signals)
-    asyncio.gather(read_inbox(inbox, controller))
+async def read_inbox(inbox: ControllerInbox, controller: Controller):
+    # The controller's transitions are non-blocking, so they are called directly on the event loop
+    # rather than being offloaded to a thread. The method is bound once, not for every message.
+    handle_message = controller.handle_message
 
+    while True:
+        # Handle any messages that piled up as one batch
+        messages = [await inbox.read()]
+        messages.extend(inbox.read_available())
 
-def start_asyncio_event_loop(loop: asyncio.AbstractEventLoop) -> None:
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
-
+        # A repeated start, stop, or abort leaves the controller in the same state that the first
+        # one did, so consecutive duplicates are only handled once
+        for message, _ in groupby(messages):
+            handle_message(message)
 
-def run_event_loop(inbox: asyncio.Queue, loop: asyncio.AbstractEventLoop, signals: list[Signal]) -> None:
-    thread = Thread(target=start_asyncio_event_loop, args=(loop,), daemon=True)
-    thread.start()
 
-    asyncio.run_coroutine_threadsafe(asyncio_main(inbox, signals), loop=loop)
+async def asyncio_main(inbox: ControllerInbox, signals: list[Signal]):
+    controller = Controller(IDLE, signals)
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(read_inbox(inbox, controller))
 
 
 if __name__ == "__main__":
     application = QApplication(sys.argv)
+
+    # Run the `asyncio` event loop on the GUI thread by integrating it into Qt's event loop
+    asyncio_event_loop = qasync.QEventLoop(application)
+    asyncio.set_event_loop(asyncio_event_loop)
+
     window = MainWindow()
-    asyncio_queue = window._asyncio_queue
-    asyncio_event_loop = window._asyncio_event_loop
 
-    run_event_loop(inbox=asyncio_queue, loop=asyncio_event_loop, signals=window.signals)
-    sys.exit(application.exec())
+    with asyncio_event_loop:
+        asyncio_event_loop.create_task(asyncio_main(window._controller_inbox, window.signals))
+        asyncio_event_loop.run_forever()
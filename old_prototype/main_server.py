@@ -1,8 +1,22 @@
 import asyncio
 from websockets.server import serve
 import functools
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+from queue import SimpleQueue
 import websockets
 
+# The event loop is set up the same way as in `prototype.event_loop`, which is not imported so that
+# this script can be run on its own from this directory
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+_logger = logging.getLogger(__name__)
+
 
 async def receive_websocket_message(websocket, send_queue: asyncio.Queue, receive_queue: asyncio.Queue):
     # This also should handle application state. For example,
@@ -10,7 +24,7 @@ async def receive_websocket_message(websocket, send_queue: asyncio.Queue, receiv
     # state which would then potentially trigger new messages
     # to the TCP client(s).
     async for message in websocket:
-        print(f"The WebSocket server received: {message}")
+        _logger.debug("The WebSocket server received: %s", message)
         send_queue.put_nowait(message)
         response = await receive_queue.get()
         await websocket.send(response)
@@ -34,13 +48,13 @@ async def tcp_client(send_queue: asyncio.Queue, receive_queue: asyncio.Queue):
         while True:
             try:
                 message: str = await send_queue.get()
-                print(f"The TCP client received: {message}")
+                _logger.debug("The TCP client received: %s", message)
                 writer.write(f"message\n".encode())
-                print("I WROTE SOMETHING")
+                _logger.debug("The TCP client wrote the message")
                 await writer.drain()
 
                 data = await reader.readline()
-                print(f"The TCP client received a response from the server: {data.decode()}")
+                _logger.debug("The TCP client received a response from the server: %r", data)
                 receive_queue.put_nowait(data)
             except ConnectionResetError:
                 # Re-open the connection
@@ -51,14 +65,37 @@ async def tcp_client(send_queue: asyncio.Queue, receive_queue: asyncio.Queue):
 
 
 async def main():
+    # Log records are put on a queue and then written by a background thread, so that logging
+    # never blocks the event loop on writing to the console
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    log_listener = QueueListener(log_queue, log_handler)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # The per-message records are debug records, so they are only written when `LOG_LEVEL` is
+    # set to "DEBUG"
+    root_logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    log_listener.start()
+
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Create queues to pass messages back and forth
     send_queue = asyncio.Queue()
     receive_queue = asyncio.Queue()
 
-    await asyncio.gather(
-        websocket_server(send_queue, receive_queue),
-        tcp_client(send_queue, receive_queue),
-    )
+    # If either the WebSocket server or the TCP client fails, then the task group cancels the
+    # other one rather than leaving it running without its counterpart
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(websocket_server(send_queue, receive_queue))
+            task_group.create_task(tcp_client(send_queue, receive_queue))
+    finally:
+        log_listener.stop()
 
 
-asyncio.run(main())
+if uvloop:
+    uvloop.run(main())
+else:
+    asyncio.run(main())
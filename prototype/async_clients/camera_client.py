@@ -7,23 +7,32 @@ from prototype.async_core.mixins import AsyncTCPClientMixin
 
 @final
 class CameraClient(AsyncTCPClientMixin):
+    __slots__ = ()
+
+    # The commands are encoded once, including their terminating newline, rather than being
+    # formatted and encoded on every request
+    _START_EXPOSURE = b"start_exposure\n"
+    _STOP_EXPOSURE = b"stop_exposure\n"
+    _GET_STATE = b"get_state\n"
+    _GET_EXPOSING_TIME = b"get_exposing_time\n"
+
+    # The camera server's responses are states, "ok", or an exposing time, which are all far
+    # shorter than this, so the stream reader's buffer is kept small
+    _STREAM_LIMIT = 128
+
     def __init__(self, ip_address: str, port: int) -> None:
-        super().__init__(ip_address, port)
+        super().__init__(ip_address, port, limit=self._STREAM_LIMIT)
 
     async def start_exposure(self) -> None:
-        await self._write("start_exposure")
-        await self._read()
+        await self._request_bytes(self._START_EXPOSURE)
 
     async def stop_exposure(self) -> None:
-        await self._write("stop_exposure")
-        await self._read()
+        await self._request_bytes(self._STOP_EXPOSURE)
 
     async def get_state(self) -> str:
-        await self._write("get_state")
-        response = await self._read()
+        response = await self._request_bytes(self._GET_STATE)
         return response
 
     async def get_exposing_time(self) -> float:
-        await self._write("get_exposing_time")
-        response = await self._read()
+        response = await self._request_bytes(self._GET_EXPOSING_TIME)
         return float(response)
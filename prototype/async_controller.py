@@ -7,8 +7,9 @@ that is to be used inside an `asyncio` coroutine or task.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
-from enum import Enum, auto, verify, UNIQUE
-from typing import override, final
+from enum import IntEnum, auto, verify, CONTINUOUS, UNIQUE
+from itertools import groupby
+from typing import ClassVar, override, final
 
 # Project dependencies
 from prototype.async_workers.camera_worker import AsyncCameraWorker, CameraMessage
@@ -16,27 +17,64 @@ from prototype.async_core.messaging import AsyncInbox
 from prototype.signals import Signals
 
 
+# Bit flags for the messages that a state handles, which are set in a state's `HANDLES`
+HANDLES_START_CAMERA_EXPOSURE = 1 << 0
+HANDLES_STOP_CAMERA_EXPOSURE = 1 << 1
+HANDLES_ABORT_CAMERA_EXPOSURE = 1 << 2
+HANDLES_GET_EXPOSING_TIME = 1 << 3
+
+# The smallest change in the exposing time, in seconds, that is emitted to the GUI
+EXPOSING_TIME_EPSILON = 1e-3
+
+
 @final
 class AsyncController:
     """A class implementing a controller intended to run as a concurrent task in
     an `asyncio` event loop. The controller implements a state machine via the standard
     OOP state pattern. The methods are intended to be called via a message passing
-    mechanism using an `AsyncInbox`, which is why the static method `send_controller_message`
-    is provided.
+    mechanism using an `AsyncInbox`, which is read by `read_inbox`.
     """
 
-    def __init__(self, initial_state: IState, signals: Signals) -> None:
+    __slots__ = (
+        "__states",
+        "__state",
+        "__camera_worker",
+        "__camera_worker_task",
+        "__last_emitted_exposing_time",
+        "__emit_exposing_time",
+        "__camera_exposing",
+    )
+
+    def __init__(self, initial_state: StateId, signals: Signals) -> None:
         """Construct the initial instance variables but do not call any coroutines.
         For that, see the `initialize` method.
         """
-        self.__state = initial_state
-        self.__signals = signals
+        # Every state is constructed once up front, so that a transition only needs to look
+        # up the state that is being transitioned to rather than construct a new one
+        self.__states: dict[StateId, IState] = {
+            StateId.IDLE: Idle(),
+            StateId.CAMERA_EXPOSING: CameraExposing(),
+            StateId.SAVING_CAMERA_IMAGES: SavingCameraImages(),
+            StateId.ABORTING_CAMERA_EXPOSURE: AbortingCameraExposure(),
+        }
+        self.__state = self.__states[initial_state]
         self.__camera_worker = AsyncCameraWorker("127.0.0.1", 8888)
 
-        # Set initial state properties
-        self.__state.controller = self
-        self.__state.signals = signals
-        self.__state.camera_client = self.__camera_worker
+        # Cache the bound `emit` method of the exposing time signal, which is emitted from the
+        # status poll, so that the signal is not looked up on every poll
+        self.__emit_exposing_time = signals.set_exposing_time.emit
+
+        # The exposing time that was last emitted to the GUI. It starts as NaN so that the first
+        # exposing time is always emitted.
+        self.__last_emitted_exposing_time = float("nan")
+
+        # Set while the camera is exposing, which is the only time that statuses need polling
+        self.__camera_exposing = asyncio.Event()
+
+        # Attach the states to the controller, which is the same for every state, once for all of
+        # the states
+        for state in self.__states.values():
+            state.attach(self, signals, self.__camera_worker)
 
         # Declare instance variables
         self.__camera_worker_task: asyncio.Task
@@ -50,17 +88,19 @@ class AsyncController:
         )
         await self.__state.on_entry()
 
-    async def _transition_to(self, new_state: IState) -> None:
+    async def _transition_to(self, new_state: StateId) -> None:
         """Transition from the current state to the given new state. This calls
         the `on_exit` method on the current state and the `on_entry` of the
         new state. This method should not be called by any object other than
-        concrete implementations of `IState`.
+        concrete implementations of `IState`. Transitioning to the current state
+        does nothing, so that neither `on_exit` nor `on_entry` are called again.
         """
+        state = self.__states[new_state]
+        if state is self.__state:
+            return
+
         await self.__state.on_exit()
-        self.__state = new_state
-        self.__state.controller = self
-        self.__state.signals = self.__signals
-        self.__state.camera_client = self.__camera_worker
+        self.__state = state
         await self.__state.on_entry()
 
     @property
@@ -68,59 +108,94 @@ class AsyncController:
         """Get the current state"""
         return self.__state
 
-    @staticmethod
-    async def send_controller_message(
-        inbox: AsyncInbox[ControllerMessage], message: ControllerMessage
-    ):
-        inbox.send(message)
+    @property
+    def camera_exposing(self) -> asyncio.Event:
+        """An event that is set while the camera is exposing and cleared otherwise"""
+        return self.__camera_exposing
 
     # Messages that the controller can be "sent" by calling methods on it.
     # The messages are then deferred down to the specific state that the
-    # controller is in.
+    # controller is in, but only if the state handles the message. This
+    # avoids creating and awaiting a coroutine for a state's no-op handler.
 
     async def start_camera_exposure(self) -> None:
-        await self.__state.start_camera_exposure()
+        state = self.__state
+        if state.HANDLES & HANDLES_START_CAMERA_EXPOSURE:
+            await state.start_camera_exposure()
 
     async def stop_camera_exposure(self) -> None:
-        await self.__state.stop_camera_exposure()
+        state = self.__state
+        if state.HANDLES & HANDLES_STOP_CAMERA_EXPOSURE:
+            await state.stop_camera_exposure()
 
     async def abort_camera_exposure(self) -> None:
-        await self.__state.abort_camera_exposure()
+        state = self.__state
+        if state.HANDLES & HANDLES_ABORT_CAMERA_EXPOSURE:
+            await state.abort_camera_exposure()
+
+    def reset_last_emitted_exposing_time(self) -> None:
+        """Forget the exposing time that was last emitted, so that the next exposing time is
+        always emitted. The GUI resets its display of the exposing time whenever it changes state,
+        so this is called whenever an exposure starts or ends.
+        """
+        self.__last_emitted_exposing_time = float("nan")
 
     async def get_exposing_time(self) -> float:
-        exposing_time = await self.__state.get_exposing_time()
-        self.__signals.set_exposing_time.emit(exposing_time)
+        state = self.__state
+        if state.HANDLES & HANDLES_GET_EXPOSING_TIME:
+            exposing_time = await state.get_exposing_time()
+        else:
+            exposing_time = 0.0
+
+        # Emitting a signal crosses into Qt, so the exposing time is only emitted when it has
+        # changed. This is written as `not <=` so that the initial NaN compares as changed.
+        if not abs(exposing_time - self.__last_emitted_exposing_time) <= EXPOSING_TIME_EPSILON:
+            self.__emit_exposing_time(exposing_time)
+            self.__last_emitted_exposing_time = exposing_time
         return exposing_time
 
 
 class IState(ABC):
     """Serve as an interface between the controller and the explicit, individual states."""
 
-    @property
-    def controller(self) -> AsyncController:
-        return self.__controller
-
-    @controller.setter
-    def controller(self, controller: AsyncController) -> None:
-        self.__controller = controller
-
-    @property
-    def signals(self) -> Signals:
-        return self.__signals
-
-    @signals.setter
-    def signals(self, signals: Signals):
-        self.__signals = signals
-
-    @property
-    def camera_client(self) -> AsyncCameraWorker:
-        return self.__camera_worker
+    # The states live for the lifetime of the controller, so `__slots__` is used on the states to
+    # keep them small and make their attribute access fast. Concrete states should also set an
+    # empty `__slots__`.
+    __slots__ = (
+        "controller",
+        "camera_client",
+        "_emit_idle",
+        "_emit_camera_exposing",
+        "_emit_saving_camera_images",
+        "_emit_aborting_camera_exposure",
+    )
+
+    # The bit flags of the messages that the state handles. The controller only calls a state's
+    # handler for a message if its bit is set, so a handler whose bit is not set must do nothing,
+    # or in the case of `get_exposing_time`, return 0.0.
+    HANDLES: ClassVar[int] = 0
+
+    # Declare the types of the attributes that are set by `attach`
+    controller: AsyncController
+    camera_client: AsyncCameraWorker
+
+    def attach(
+        self, controller: AsyncController, signals: Signals, camera_client: AsyncCameraWorker
+    ) -> None:
+        """Attach the state to the controller that it belongs to, the signals it emits, and the
+        camera worker it uses. This is done by the controller once, when the state is created.
+        """
+        self.controller = controller
+        self.camera_client = camera_client
 
-    @camera_client.setter
-    def camera_client(self, camera_client: AsyncCameraWorker):
-        self.__camera_worker = camera_client
+        # Only the bound `emit` methods of the transition signals are kept, so that a state can emit
+        # its signal when entered without looking up the signal each time
+        self._emit_idle = signals.transition_to_idle.emit
+        self._emit_camera_exposing = signals.transition_to_camera_exposing.emit
+        self._emit_saving_camera_images = signals.transition_to_saving_camera_images.emit
+        self._emit_aborting_camera_exposure = signals.transition_to_aborting_camera_exposure.emit
 
-    async def _transition_to(self, new_state: IState) -> None:
+    async def _transition_to(self, new_state: StateId) -> None:
         await self.controller._transition_to(new_state)  # pylint: disable=protected-access
 
     async def on_entry(self) -> None:
@@ -152,14 +227,17 @@ class IState(ABC):
 
 
 class Idle(IState):
+    __slots__ = ()
+    HANDLES = HANDLES_START_CAMERA_EXPOSURE
+
     @override
     async def on_entry(self):
-        self.signals.transition_to_idle.emit()
+        self._emit_idle()
         print("Idling ...")
 
     @override
     async def start_camera_exposure(self) -> None:
-        await self._transition_to(CameraExposing())
+        await self._transition_to(StateId.CAMERA_EXPOSING)
 
     @override
     async def stop_camera_exposure(self) -> None:
@@ -175,15 +253,24 @@ class Idle(IState):
 
 
 class CameraExposing(IState):
+    __slots__ = ()
+    HANDLES = (
+        HANDLES_STOP_CAMERA_EXPOSURE | HANDLES_ABORT_CAMERA_EXPOSURE | HANDLES_GET_EXPOSING_TIME
+    )
+
     @override
     async def on_entry(self) -> None:
-        self.signals.transition_to_camera_exposing.emit()
+        self._emit_camera_exposing()
         print("Starting camera exposure ...")
         self.camera_client.send(CameraMessage.START_EXPOSURE)
+        self.controller.reset_last_emitted_exposing_time()
+        self.controller.camera_exposing.set()
 
     @override
     async def on_exit(self) -> None:
         print("Stopping camera exposure ...")
+        self.controller.camera_exposing.clear()
+        self.controller.reset_last_emitted_exposing_time()
         self.camera_client.send(CameraMessage.STOP_EXPOSURE)
 
     @override
@@ -192,11 +279,11 @@ class CameraExposing(IState):
 
     @override
     async def stop_camera_exposure(self) -> None:
-        await self._transition_to(SavingCameraImages())
+        await self._transition_to(StateId.SAVING_CAMERA_IMAGES)
 
     @override
     async def abort_camera_exposure(self) -> None:
-        await self._transition_to(AbortingCameraExposure())
+        await self._transition_to(StateId.ABORTING_CAMERA_EXPOSURE)
 
     @override
     async def get_exposing_time(self) -> float:
@@ -207,15 +294,18 @@ class CameraExposing(IState):
 
 
 class SavingCameraImages(IState):
+    __slots__ = ()
+    HANDLES = 0
+
     @override
     async def on_entry(self) -> None:
-        self.signals.transition_to_saving_camera_images.emit()
+        self._emit_saving_camera_images()
         print("Saving camera images ...")
 
         # Simulate saving images by sleeping 2 seconds
         await asyncio.sleep(2)
 
-        await self._transition_to(Idle())
+        await self._transition_to(StateId.IDLE)
 
     @override
     async def start_camera_exposure(self) -> None:
@@ -235,15 +325,18 @@ class SavingCameraImages(IState):
 
 
 class AbortingCameraExposure(IState):
+    __slots__ = ()
+    HANDLES = 0
+
     @override
     async def on_entry(self) -> None:
-        self.signals.transition_to_aborting_camera_exposure.emit()
+        self._emit_aborting_camera_exposure()
         print("Aborting camera exposure ...")
 
         # Simulate throwing away images and other tasks by sleeping 2 seconds
         await asyncio.sleep(2)
 
-        await self._transition_to(Idle())
+        await self._transition_to(StateId.IDLE)
 
     @override
     async def start_camera_exposure(self) -> None:
@@ -263,39 +356,56 @@ class AbortingCameraExposure(IState):
 
 
 @verify(UNIQUE)
-class ControllerMessage(Enum):
-    START_CAMERA_EXPOSURE = auto()
-    STOP_CAMERA_EXPOSURE = auto()
-    ABORT_CAMERA_EXPOSURE = auto()
-    GET_EXPOSING_TIME = auto()
+class StateId(IntEnum):
+    """Identifies each of the states of the `AsyncController` state machine"""
+
+    IDLE = auto()
+    CAMERA_EXPOSING = auto()
+    SAVING_CAMERA_IMAGES = auto()
+    ABORTING_CAMERA_EXPOSURE = auto()
+
+
+# The messages are numbered contiguously from zero so that they can index a tuple of handlers
+@verify(UNIQUE, CONTINUOUS)
+class ControllerMessage(IntEnum):
+    START_CAMERA_EXPOSURE = 0
+    STOP_CAMERA_EXPOSURE = 1
+    ABORT_CAMERA_EXPOSURE = 2
 
 
 async def read_inbox(inbox: AsyncInbox[ControllerMessage], controller: AsyncController):
     """Read the inbox, by blocking until a message arrives, and then delegate the message
-    to an `AsyncController` method.
+    to an `AsyncController` method. Any messages that piled up while the previous messages were
+    being handled are read and handled as one batch, with repeats of the same message coalesced.
     """
-    while True:
-        message = await inbox.read()
-        match message:
-            case ControllerMessage.START_CAMERA_EXPOSURE:
-                await controller.start_camera_exposure()
-
-            case ControllerMessage.STOP_CAMERA_EXPOSURE:
-                await controller.stop_camera_exposure()
+    # Bind the controller's methods once rather than matching and resolving them for every
+    # message. The handlers are indexed by the message, so they must be in `ControllerMessage`'s
+    # order.
+    handlers = (
+        controller.start_camera_exposure,
+        controller.stop_camera_exposure,
+        controller.abort_camera_exposure,
+    )
 
-            case ControllerMessage.ABORT_CAMERA_EXPOSURE:
-                await controller.abort_camera_exposure()
+    while True:
+        messages = [await inbox.read(), *inbox.read_available()]
 
-            case ControllerMessage.GET_EXPOSING_TIME:
-                await controller.get_exposing_time()
+        # A repeated start, stop, or abort leaves the controller in the same state that the first
+        # one did, so consecutive duplicates are only handled once
+        for message, _ in groupby(messages):
+            await handlers[message]()
 
 
-async def periodically_get_status(inbox: AsyncInbox[ControllerMessage]):
-    """A task that periodically, at 10Hz, sends a message to the controller to get various
-    statuses from the underlying tasks.
+async def periodically_get_status(controller: AsyncController):
+    """A task that periodically, at 10Hz, gets various statuses from the underlying tasks. The
+    task runs on the same event loop as the controller, so the controller is called directly
+    rather than sent a message through its inbox. The statuses only change while the camera is
+    exposing, so the task waits, without polling, whenever the camera is not exposing.
     """
+    camera_exposing = controller.camera_exposing
     while True:
-        inbox.send(ControllerMessage.GET_EXPOSING_TIME)
+        await camera_exposing.wait()
+        await controller.get_exposing_time()
         await asyncio.sleep(0.1)
 
 
@@ -303,6 +413,8 @@ async def async_controller_main(inbox: AsyncInbox[ControllerMessage], signals: S
     """This is the main `asyncio` coroutine that launches concurrent tasks, running the
     `AsyncController` state machine that centrally manages the various tasks.
     """
-    controller = AsyncController(initial_state=Idle(), signals=signals)
+    controller = AsyncController(initial_state=StateId.IDLE, signals=signals)
     await controller.initialize()
-    asyncio.gather(read_inbox(inbox, controller), periodically_get_status(inbox))
+    async with asyncio.TaskGroup() as task_group:
+        task_group.create_task(read_inbox(inbox, controller))
+        task_group.create_task(periodically_get_status(controller))
@@ -4,6 +4,8 @@
 # The `__future__` import must be listed first. Otherwise, a `SyntaxError` is emitted.
 from __future__ import annotations
 import asyncio
+from collections import deque
+from enum import Enum, auto
 from typing import Generic, TypeVar, Any, final, override
 
 # Project dependencies
@@ -13,18 +15,70 @@ from prototype.async_core.mixins import AsyncLoggingMixin
 Message = TypeVar("Message")
 
 
+class OverflowPolicy(Enum):
+    """What `AsyncInbox.send` does when a message is sent to a full inbox"""
+
+    # Raise `asyncio.QueueFull` and do not send the message
+    RAISE = auto()
+    # Drop the oldest message in the inbox to make room for the message
+    DROP_OLDEST = auto()
+    # Drop the message that is being sent
+    DROP_NEWEST = auto()
+
+
 @final
 class AsyncInbox(Generic[Message], AsyncLoggingMixin):
     """A typed inbox that is for use in `async` tasks to send messages
     back and forth. The read is intentionally blocking, to mimic actor
     communication. Thus, it is important that the `read` coroutine is ran
     in an individual tasks, as awaiting it will block the task.
+
+    Like `asyncio.Queue`, the inbox is not thread-safe and must only be used from within the
+    event loop that reads it. To send a message from another thread, schedule the `send`
+    method on the event loop with `loop.call_soon_threadsafe`.
     """
 
-    def __init__(self, name: str = "", maxsize: int = 0) -> None:
-        """The `AsyncInbox` is simply a wrapper over the core `asyncio.Queue`"""
+    __slots__ = (
+        "__name",
+        "__maxsize",
+        "__overflow_policy",
+        "__messages",
+        "__loop",
+        "__reader_waiter",
+        "__reply_channels",
+    )
+
+    def __init__(
+        self,
+        name: str = "",
+        maxsize: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.RAISE,
+    ) -> None:
+        """The `AsyncInbox` is a `collections.deque` of messages along with a future that the
+        reader waits on when the inbox is empty, which is resolved when a message is sent. Since
+        the inbox is only used from within a single event loop and has a single reader, this
+        avoids the overhead of the waiter bookkeeping done by an `asyncio.Queue` or
+        `asyncio.Event`. If `maxsize` is greater than zero, then the `overflow_policy` determines
+        what happens when a message is sent to a full inbox. Dropping the oldest message suits an
+        inbox of periodic readings, where only the latest reading matters. Sending a synchronous
+        message to a full inbox always raises `asyncio.QueueFull`, since a dropped synchronous
+        message would never be replied to. For the same reason, if the oldest message that is
+        dropped is a synchronous message, then `asyncio.QueueFull` is raised to its sender.
+        """
         self.__name = name
-        self.__queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.__maxsize = maxsize
+        self.__overflow_policy = overflow_policy
+        self.__messages: deque[Message | tuple[Message, ReplyChannel]] = deque()
+
+        # The inbox does not create anything bound to an event loop until it is used, so it can
+        # be constructed outside of the event loop. The event loop is then cached the first time
+        # the reader waits, unless it has already been given with `bind`.
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__reader_waiter: asyncio.Future[None] | None = None
+
+        # Reply channels whose reply has been read, which are reused by `send_synchronous` rather
+        # than creating a new reply channel for every synchronous message
+        self.__reply_channels: list[ReplyChannel[Any]] = []
 
     @override  # for AsyncLoggingMixin
     def async_log_name(self) -> str:
@@ -33,19 +87,53 @@ class AsyncInbox(Generic[Message], AsyncLoggingMixin):
         else:
             return f"{self}"
 
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the inbox to the event loop that it will be used from. This is only needed when
+        the inbox is constructed outside of that event loop, such as in another thread.
+        """
+        self.__loop = loop
+
+    def __put(self, message: Message | tuple[Message, ReplyChannel]) -> None:
+        """Put the message into the inbox and wake up the reader if it is waiting"""
+        if 0 < self.__maxsize <= len(self.__messages):
+            raise asyncio.QueueFull
+        self.__messages.append(message)
+        waiter = self.__reader_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
     def send(self, message: Message) -> None:
-        """Send a message immediately to the inbox"""
-        self.__queue.put_nowait(message)
-        self.async_log_debug(f"<Message: {message}> was sent to inbox")
+        """Send a message immediately to the inbox. If the inbox is full, then the message is
+        either not sent, or makes room for itself, according to the inbox's `OverflowPolicy`.
+        """
+        if (
+            0 < self.__maxsize <= len(self.__messages)
+            and self.__overflow_policy is not OverflowPolicy.RAISE
+        ):
+            if self.__overflow_policy is OverflowPolicy.DROP_NEWEST:
+                self.async_log_debug("<Message: %s> was dropped by full inbox", message)
+                return
+            dropped_message = self.__messages.popleft()
+            self.async_log_debug("<Message: %s> was dropped by full inbox", dropped_message)
+            if type(dropped_message) is tuple:  # pylint: disable=unidiomatic-typecheck
+                # The sender of a synchronous message is waiting on a reply that will never come
+                dropped_message[1].fail(asyncio.QueueFull())
+        self.__put(message)
+        self.async_log_debug("<Message: %s> was sent to inbox", message)
 
     async def send_synchronous(self, message: Message) -> Any:
         """Sends a message immediately and synchronously to the inbox. This means that
         the caller is expecting a reply and will not continue until the reply arrives.
         Currently, it is up to the sender to know what type to expect back.
         """
-        reply_channel = ReplyChannel[Any]()
-        self.__queue.put_nowait((message, reply_channel))
-        return await reply_channel.read_reply()
+        reply_channel = self.__reply_channels.pop() if self.__reply_channels else ReplyChannel()
+        self.__put((message, reply_channel))
+        reply = await reply_channel.read_reply()
+
+        # The reply has been read, so the reply channel is empty again and can be reused. If the
+        # read was cancelled, then a reply may still arrive, so the reply channel is not reused.
+        self.__reply_channels.append(reply_channel)
+        return reply
 
     async def read(self) -> Message | tuple[Message, ReplyChannel]:
         """Block on the inbox until a message is received and then return
@@ -53,10 +141,42 @@ class AsyncInbox(Generic[Message], AsyncLoggingMixin):
         the coroutine that it is awaited on.
         """
         self.async_log_debug("Waiting for a message")
-        message = await self.__queue.get()
-        self.async_log_debug(f"<Message: {message}> was read from inbox")
+        while not self.__messages:
+            # A future is only created when the reader actually has to wait
+            loop = self.__loop
+            if loop is None:
+                loop = self.__loop = asyncio.get_running_loop()
+            self.__reader_waiter = loop.create_future()
+            try:
+                await self.__reader_waiter
+            finally:
+                self.__reader_waiter = None
+        message = self.__messages.popleft()
+        self.async_log_debug("<Message: %s> was read from inbox", message)
         return message
 
+    async def read_batch(self, max_count: int) -> list[Message | tuple[Message, ReplyChannel]]:
+        """Block on the inbox until a message is received and then return that message along
+        with any other messages that are already in the inbox, up to `max_count` messages in
+        total. The messages are returned in the order they were sent.
+        """
+        messages = [await self.read()]
+        pending_messages = self.__messages
+        for _ in range(min(max_count - 1, len(pending_messages))):
+            messages.append(pending_messages.popleft())
+        self.async_log_debug("%d messages were read from inbox", len(messages))
+        return messages
+
+    def read_available(self) -> list[Message | tuple[Message, ReplyChannel]]:
+        """Read all of the messages that are currently in the inbox without blocking. The
+        messages are returned in the order they were sent, and if the inbox is empty, then
+        an empty list is returned.
+        """
+        messages = list(self.__messages)
+        self.__messages.clear()
+        self.async_log_debug("%d messages were read from inbox", len(messages))
+        return messages
+
 
 @final
 class ReplyChannel(Generic[Message]):
@@ -66,18 +186,42 @@ class ReplyChannel(Generic[Message]):
     in an individual tasks, as awaiting it will block the task.
     """
 
+    __slots__ = ("__reply",)
+
     def __init__(self) -> None:
-        """The `ReplyChannel` is simply a wrapper over the core `asyncio.Queue`
-        with a maximum size set to 1
+        """The `ReplyChannel` is simply a wrapper over an `asyncio.Future`, since it is only used
+        to deliver the reply to a single message. The future is created when it is first needed,
+        so that a `ReplyChannel` can be constructed outside of a running event loop.
         """
-        # A maximum size of 1 is set because this is only used to put the result of a single
-        # message on the queue to be immediately read.
-        self.__queue: asyncio.Queue = asyncio.Queue(1)
+        self.__reply: asyncio.Future[Message] | None = None
+
+    def __future(self) -> asyncio.Future[Message]:
+        """Get the future for the current reply, creating it if needed"""
+        if self.__reply is None:
+            self.__reply = asyncio.get_running_loop().create_future()
+        return self.__reply
 
     def reply(self, message: Message) -> None:
-        """Reply with the message"""
-        self.__queue.put_nowait(message)
+        """Reply with the message. If the reader has stopped waiting on the reply, such as by
+        being cancelled, then the reply is dropped.
+        """
+        future = self.__future()
+        if not future.done():
+            future.set_result(message)
+
+    def fail(self, exception: BaseException) -> None:
+        """Fail the reply with the exception, which is then raised to the reader of the reply
+        instead of a reply being returned. If the reader has stopped waiting on the reply, such as
+        by being cancelled, or the reply has already been sent, then the exception is dropped.
+        """
+        future = self.__future()
+        if not future.done():
+            future.set_exception(exception)
 
     async def read_reply(self) -> Message:
-        """Read the reply that was sent to the channel"""
-        return await self.__queue.get()
+        """Read the reply that was sent to the channel. Once the reply is read, the channel is
+        reset so that it can be used for the reply to another message.
+        """
+        reply = await self.__future()
+        self.__reply = None
+        return reply
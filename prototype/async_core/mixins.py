@@ -6,14 +6,29 @@ and workers easier
 from abc import ABC, abstractmethod
 import asyncio
 import logging
+import socket
 from typing import final
 
 
+# The newline character that terminates every message, encoded once
+_NEWLINE = b"\n"
+
+# The default size of a stream reader's buffer, which is the same as `asyncio`'s default
+DEFAULT_STREAM_LIMIT = 2**16
+
+# `asyncio` code must log to the "asyncio" logger, which is looked up once rather than per message
+_asyncio_logger = logging.getLogger("asyncio")
+
+
 class AsyncLoggingMixin(ABC):
     """A mixin to provide easy `asyncio` logging. Simply override the `_async_log_name` and
     then call the `_async_log_debug` method to use.
     """
 
+    # The only slot is the cached log prefix, which still lets classes that use this mixin define
+    # their own `__slots__`
+    __slots__ = ("__log_prefix",)
+
     @abstractmethod
     def async_log_name(self) -> str:
         """The logging name that the concrete implementation should override. The name
@@ -22,12 +37,23 @@ class AsyncLoggingMixin(ABC):
         ...
 
     @final
-    def async_log_debug(self, log_message: str) -> None:
+    def async_log_debug(self, log_message: str, *args: object) -> None:
         """Logs to the "asyncio" logger, which is required for when logging from a
         coroutine. Uses the required override of `_async_log_name` to create a log
-        message of the form `<_async_log_name>: <log_message>`.
+        message of the form `<_async_log_name>: <log_message>`. Like the `logging` module, any
+        `args` are merged into the log message using `%`-formatting, so that callers do not need
+        to format the log message themselves when debug logging is disabled.
         """
-        logging.getLogger("asyncio").debug(f"{self.async_log_name()}: {log_message}")
+        # The log message is only formatted, and the log prefix only computed, when debug logging
+        # is enabled. The log prefix is computed once, the first time it is needed.
+        if _asyncio_logger.isEnabledFor(logging.DEBUG):
+            try:
+                log_prefix = self.__log_prefix
+            except AttributeError:
+                log_prefix = self.__log_prefix = f"{self.async_log_name()}: "
+            if args:
+                log_message = log_message % args
+            _asyncio_logger.debug("%s%s", log_prefix, log_message)
 
 
 class AsyncTCPClientMixin(ABC):
@@ -37,12 +63,21 @@ class AsyncTCPClientMixin(ABC):
     behavior.
 
     A concrete user of this mixin should call this mixin's `__init__` method and use
-    the `_write` and `_read` methods to make TCP/IP writes and reads, respectively.
+    the `_write` and `_read` methods to make TCP/IP writes and reads, respectively, or
+    the `_request` method to make a write that is followed by reading the response.
     """
 
-    def __init__(self, ip_address: str, port: int) -> None:
+    __slots__ = ("__ip_address", "__port", "__limit", "__reader", "__writer")
+
+    def __init__(self, ip_address: str, port: int, limit: int = DEFAULT_STREAM_LIMIT) -> None:
+        """The `limit` is the size of the stream reader's buffer and thus the longest response,
+        including its newline, that can be read. A response that is longer than the limit raises
+        `asyncio.LimitOverrunError`. A concrete implementation whose responses are known to be
+        short can lower the limit to match them.
+        """
         self.__ip_address = ip_address
         self.__port = port
+        self.__limit = limit
         self.__reader: asyncio.StreamReader
         self.__writer: asyncio.StreamWriter
 
@@ -50,20 +85,50 @@ class AsyncTCPClientMixin(ABC):
     async def _write(self, message: str) -> None:
         """Write the message by appending a newline "\n" character at the end. This method
         is only intended to be called by a concrete implementation of this class."""
-        self.__writer.write(f"{message}\n".encode())
+        self.__writer.writelines((message.encode(), _NEWLINE))
+        await self.__writer.drain()
+
+    @final
+    async def _write_bytes(self, payload: bytes) -> None:
+        """The same as `_write` except that the message is given as already encoded bytes,
+        which must include the terminating newline "\n" character. This method is only
+        intended to be called by a concrete implementation of this class.
+        """
+        self.__writer.write(payload)
         await self.__writer.drain()
 
     @final
     async def _read(self) -> str:
         """Reads a line by waiting for a newline "\n" character. The newline character
         is not returned in the response string. In fact, all whitespace is trimmed from
-        both the beginning and end of the response string. This method is only intended
+        both the beginning and end of the response string. If the connection is closed before
+        a newline is received, then `asyncio.IncompleteReadError` is raised. This method is only
+        intended to be called by a concrete implementation of this class.
+        """
+        response_data: bytes = await self.__reader.readuntil(_NEWLINE)
+        # Strip any whitespace while the response is still bytes, so that decoding creates the
+        # only string
+        return response_data.strip().decode()
+
+    @final
+    async def _request(self, message: str) -> str:
+        """Write the message and then read the response, with the same behavior as calling
+        `_write` followed by `_read` but in a single coroutine. This method is only intended
         to be called by a concrete implementation of this class.
         """
-        response_data: bytes = await self.__reader.readline()
-        # Decode and strip any whitespace from the response string
-        response: str = response_data.decode().strip()
-        return response
+        return await self._request_bytes(message.encode() + _NEWLINE)
+
+    @final
+    async def _request_bytes(self, payload: bytes) -> str:
+        """The same as `_request` except that the message is given as already encoded bytes,
+        which must include the terminating newline "\n" character. This allows a concrete
+        implementation to encode the messages it sends often only once. This method is only
+        intended to be called by a concrete implementation of this class.
+        """
+        self.__writer.write(payload)
+        await self.__writer.drain()
+        response_data: bytes = await self.__reader.readuntil(_NEWLINE)
+        return response_data.strip().decode()
 
     @final
     async def initialize(self) -> None:
@@ -72,7 +137,17 @@ class AsyncTCPClientMixin(ABC):
         If a concrete implementation needs specialized initialization, then override the
         `_specialized_initialize` method.
         """
-        reader, writer = await asyncio.open_connection(self.__ip_address, self.__port)
+        reader, writer = await asyncio.open_connection(
+            self.__ip_address, self.__port, limit=self.__limit
+        )
+
+        # The messages are small requests that are each waited on for a response, so latency
+        # matters more than throughput. Without a write buffer high-water mark, draining waits
+        # until a message has been handed to the socket, and with `TCP_NODELAY`, which `asyncio`
+        # normally sets already, the socket sends it without waiting to coalesce small packets.
+        writer.transport.set_write_buffer_limits(high=0)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         self.__reader = reader
         self.__writer = writer
         await self._specialized_initialize()
@@ -5,6 +5,7 @@ of whatever it is that the worker manages.
 
 # Core dependencies
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Generic, TypeVar, Any, final, override
 
 # Project dependencies
@@ -14,6 +15,15 @@ from prototype.async_core.mixins import AsyncLoggingMixin
 
 Message = TypeVar("Message")
 
+# The most messages that a worker reads from its inbox and handles at a time
+MESSAGE_BATCH_SIZE = 64
+
+
+class WorkerShutdownError(Exception):
+    """Raised to the sender of a synchronous message when the worker was shut down before it
+    replied to the message
+    """
+
 
 class AsyncWorker(Generic[Message], AsyncLoggingMixin, ABC):
     """A generic worker that manages an inbox of the specific generic type. Other coroutines,
@@ -23,10 +33,21 @@ class AsyncWorker(Generic[Message], AsyncLoggingMixin, ABC):
     implementation of this class.
     """
 
+    # Concrete workers that do not define their own `__slots__` still get an instance `__dict__`
+    __slots__ = (
+        "__name",
+        "__inbox",
+        "__run_task",
+        "__is_shutdown_scheduled",
+        "__is_initialized",
+        "__is_shutdown",
+    )
+
     def __init__(self, name: str = ""):
         self.__name = name
         self.__inbox = AsyncInbox[Message](name=name)
-        self.__keep_running = True
+        self.__run_task: asyncio.Task | None = None
+        self.__is_shutdown_scheduled = False
         self.__is_initialized = False
         self.__is_shutdown = False
 
@@ -91,39 +112,101 @@ class AsyncWorker(Generic[Message], AsyncLoggingMixin, ABC):
 
     @final
     async def run(self) -> None:
-        """Runs a loop that listens for a message on every iteration. When the message arrives, the
-        message is processed via the override of `self._receive_message`.
+        """Runs a loop that listens for messages on every iteration. When messages arrive, each
+        message is processed via the override of `self._receive_message`, or
+        `self._receive_synchronous_message` for a synchronous message. The messages that are
+        already waiting in the inbox are read and processed as one batch. Between full batches,
+        the worker yields to the event loop so that a busy worker does not starve other tasks.
+
+        The loop runs until the task running it is cancelled, either by `schedule_shutdown` or
+        from outside, or until processing a message raises an exception. In every case, the
+        `_shutdown` method is then called. A cancellation from outside is re-raised once the
+        worker has shut down, while a shutdown scheduled with `schedule_shutdown` returns normally.
+        Any synchronous messages that were not replied to, including those still in the inbox, are
+        failed with `WorkerShutdownError`, so that their senders do not wait forever.
         """
+        self.__run_task = run_task = asyncio.current_task()
+        if self.__is_shutdown_scheduled and run_task is not None:
+            # The shutdown was scheduled before the worker started running
+            run_task.cancel()
+
+        # The messages of the current batch that have not been handled yet
+        messages: list[Message | tuple[Message, ReplyChannel[Any]]] = []
+
         try:
             await self._initialize()
             self.__is_initialized = True
             self.async_log_debug("Initialized")
 
-            while self.__keep_running:
-                self.async_log_debug("Waiting on message")
-
-                msg = await self.__inbox.read()
-
-                self.async_log_debug(f'Received message "{msg}"')
-
-                match msg:
-                    case (message, reply_channel):
-                        await self._receive_synchronous_message(message, reply_channel)  # type: ignore, pylint: disable=line-too-long
-                    case message:
-                        await self._receive_message(message)  # type: ignore
+            # The methods called for every message are looked up once, rather than on every
+            # iteration of the loop
+            log_debug = self.async_log_debug
+            read_batch = self.__inbox.read_batch
+            receive_message = self._receive_message
+            receive_synchronous_message = self._receive_synchronous_message
+
+            while True:
+                log_debug("Waiting on message")
+
+                messages = await read_batch(MESSAGE_BATCH_SIZE)
+                batch_size = len(messages)
+
+                # The messages are handled from the end of the reversed batch, and each message is
+                # only removed once it has been handled, so that the messages left in the batch
+                # when the worker is shut down are exactly the ones that were not handled
+                messages.reverse()
+                while messages:
+                    msg = messages[-1]
+                    log_debug('Received message "%s"', msg)
+
+                    # Synchronous messages are sent by the inbox as a `(message, reply_channel)`
+                    # tuple. Checking the exact type is cheaper than a `match` class pattern.
+                    if type(msg) is tuple:  # pylint: disable=unidiomatic-typecheck
+                        await receive_synchronous_message(*msg)  # type: ignore
+                    else:
+                        await receive_message(msg)
+                    messages.pop()
+
+                # Reading the inbox only suspends when it is empty, so after a full batch, when
+                # more messages may be waiting, yield to let the event loop's other tasks run
+                if batch_size == MESSAGE_BATCH_SIZE:
+                    await asyncio.sleep(0)
+
+        except asyncio.CancelledError:
+            self.async_log_debug("Cancelled")
+            if not self.__is_shutdown_scheduled:
+                raise
+            # The cancellation only requested the shutdown, so it is not propagated
+            if run_task is not None:
+                run_task.uncancel()
 
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            self.async_log_debug(f"Exception: {exception}")
+            self.async_log_debug("Exception: %s", exception)
+
+        finally:
+            # The messages are never going to be handled, so release the senders of any
+            # synchronous messages that are waiting on a reply
+            for msg in messages + self.__inbox.read_available():
+                if type(msg) is tuple:  # pylint: disable=unidiomatic-typecheck
+                    msg[1].fail(WorkerShutdownError(f"{self.async_log_name()} was shut down"))
             await self._shutdown()
             self.__is_shutdown = True
             self.async_log_debug("Shutdown")
 
     @final
     def schedule_shutdown(self) -> None:
-        """Schedules the worker to shutdown, which means that it's internal `run` loop
-        will stop on the next opportunity, and then the `_shutdown` method will be called.
+        """Schedules the worker to shutdown by cancelling the task running its internal `run`
+        loop, and then the `_shutdown` method will be called. This interrupts the worker even if
+        it is waiting on its inbox or processing a message. Any messages left in the inbox are not
+        processed, and the senders of synchronous messages that were not replied to are raised a
+        `WorkerShutdownError`. Scheduling a shutdown again does nothing, so that it cannot cancel
+        the worker's `_shutdown` method while it is running.
         """
-        self.__keep_running = False
+        if self.__is_shutdown_scheduled:
+            return
+        self.__is_shutdown_scheduled = True
+        if self.__run_task is not None:
+            self.__run_task.cancel()
 
     @final
     def send(self, message: Message) -> None:
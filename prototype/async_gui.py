@@ -5,12 +5,15 @@ to and responds to state transitions
 
 # Core dependencies
 import asyncio
+from functools import partial
 import logging
+import os
 import sys
 from threading import Thread
+from typing import Any, Coroutine
 
 # Package dependencies
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtStateMachine import QState, QStateMachine
 from PySide6.QtWidgets import (
     QApplication,
@@ -23,8 +26,9 @@ from PySide6.QtWidgets import (
 )
 
 # Project dependencies
-from prototype.async_controller import AsyncController, ControllerMessage, async_controller_main
+from prototype.async_controller import ControllerMessage, async_controller_main
 from prototype.async_core.messaging import AsyncInbox
+from prototype.event_loop import new_event_loop
 from prototype.led_indicator import LedIndicator
 from prototype.signals import Signals
 
@@ -48,7 +52,8 @@ class MainWindow(QWidget):
         self._async_inbox: AsyncInbox[ControllerMessage] = AsyncInbox[ControllerMessage](
             name="AsyncController"
         )
-        self._asyncio_event_loop = asyncio.new_event_loop()
+        self._asyncio_event_loop = new_event_loop()
+        self._async_inbox.bind(self._asyncio_event_loop)
 
         # Create the state machine and the various states
         self.state_machine = QStateMachine(parent=self)
@@ -102,15 +107,17 @@ class MainWindow(QWidget):
         left_column_layout.addWidget(button_abort_exposure)
 
         # Add slots for sending messages to the controller when the buttons are pressed
-        button_start_exposure.pressed.connect(
-            lambda: self.send_controller_message(ControllerMessage.START_CAMERA_EXPOSURE)
-        )
-        button_stop_exposure.pressed.connect(
-            lambda: self.send_controller_message(ControllerMessage.STOP_CAMERA_EXPOSURE)
-        )
-        button_abort_exposure.pressed.connect(
-            lambda: self.send_controller_message(ControllerMessage.ABORT_CAMERA_EXPOSURE)
-        )
+        for button, message in (
+            (button_start_exposure, ControllerMessage.START_CAMERA_EXPOSURE),
+            (button_stop_exposure, ControllerMessage.STOP_CAMERA_EXPOSURE),
+            (button_abort_exposure, ControllerMessage.ABORT_CAMERA_EXPOSURE),
+        ):
+            # The buttons are pressed on the GUI thread, and `send_controller_message` is safe to
+            # call from it, so the slot is called directly
+            button.pressed.connect(
+                partial(self.send_controller_message, message),
+                Qt.ConnectionType.DirectConnection,
+            )
 
         # Create a label, LED indicator, and LCD number indicator and add them to the right vertical layout
         label_state = QLabel()
@@ -118,8 +125,29 @@ class MainWindow(QWidget):
         led_indicator_camera_exposing = LedIndicator()
         lcd_indicator_exposing_time = QLCDNumber()
         lcd_indicator_exposing_time.setSegmentStyle(QLCDNumber.SegmentStyle.Flat)
+
+        # The exposing time is coalesced, so that however many `set_exposing_time` signals arrive
+        # in one pass of the Qt event loop, the LCD is only updated once with the latest value
+        self._pending_exposing_time = 0.0
+        self._exposing_time_timer = QTimer(parent=self)
+        self._exposing_time_timer.setSingleShot(True)
+        self._exposing_time_timer.setInterval(0)
+
+        def display_exposing_time() -> None:
+            # An exposing time can still arrive after the camera has stopped exposing, and the
+            # state that was entered has already reset the LCD, so the exposing time is only
+            # displayed while the camera is exposing
+            if self.state_camera_exposing.active():
+                lcd_indicator_exposing_time.display(f"{self._pending_exposing_time:.1f}")
+
+        self._exposing_time_timer.timeout.connect(
+            display_exposing_time, Qt.ConnectionType.DirectConnection
+        )
+
+        # The exposing time is emitted from the `asyncio` event loop's thread, so it is always
+        # queued to be delivered on the GUI thread
         self.set_exposing_time.connect(
-            lambda number: lcd_indicator_exposing_time.display(f"{number:.1f}")
+            self._coalesce_exposing_time, Qt.ConnectionType.QueuedConnection
         )
 
         right_column_layout.addWidget(label_state)
@@ -136,59 +164,67 @@ class MainWindow(QWidget):
         state_saving_camera_images = self.state_saving_camera_images
         state_aborting_camera_exposure = self.state_aborting_camera_exposure
 
-        # For every state, add a transition for every signal to the state that the signal describes
+        # Pair every transition signal with the state that the signal describes, and for every
+        # state, add a transition for every signal to that state
+        transitions = (
+            (self.transition_to_idle, state_idle),
+            (self.transition_to_camera_exposing, state_camera_exposing),
+            (self.transition_to_saving_camera_images, state_saving_camera_images),
+            (self.transition_to_aborting_camera_exposure, state_aborting_camera_exposure),
+        )
         for state in self.states:
-            state.addTransition(self.transition_to_idle, state_idle)
-            state.addTransition(self.transition_to_camera_exposing, state_camera_exposing)
-            state.addTransition(self.transition_to_saving_camera_images, state_saving_camera_images)
-            state.addTransition(
-                self.transition_to_aborting_camera_exposure, state_aborting_camera_exposure
+            for signal, target_state in transitions:
+                state.addTransition(signal, target_state)
+
+        # Configure what happens when the states are entered by listing the property values that
+        # are set on the various GUI elements when each state is entered
+        state_properties = {
+            state_idle: (
+                (label_state, "text", "State: Idle"),
+                (led_indicator_camera_exposing, "checked", False),
+                (button_start_exposure, "enabled", True),
+                (button_stop_exposure, "enabled", False),
+                (button_abort_exposure, "enabled", False),
+                (lcd_indicator_exposing_time, "enabled", False),
+                (lcd_indicator_exposing_time, "value", 0.0),
+            ),
+            state_camera_exposing: (
+                (label_state, "text", "State: Camera exposing"),
+                (led_indicator_camera_exposing, "checked", True),
+                (button_start_exposure, "enabled", False),
+                (button_stop_exposure, "enabled", True),
+                (button_abort_exposure, "enabled", True),
+                (lcd_indicator_exposing_time, "enabled", True),
+            ),
+            state_saving_camera_images: (
+                (label_state, "text", "State: Saving camera images"),
+                (led_indicator_camera_exposing, "checked", False),
+                (button_start_exposure, "enabled", False),
+                (button_stop_exposure, "enabled", False),
+                (button_abort_exposure, "enabled", False),
+                (lcd_indicator_exposing_time, "enabled", False),
+                (lcd_indicator_exposing_time, "value", 0.0),
+            ),
+            state_aborting_camera_exposure: (
+                (label_state, "text", "State: Aborting camera exposure"),
+                (led_indicator_camera_exposing, "checked", False),
+                (button_start_exposure, "enabled", False),
+                (button_stop_exposure, "enabled", False),
+                (button_abort_exposure, "enabled", False),
+                (lcd_indicator_exposing_time, "enabled", False),
+                (lcd_indicator_exposing_time, "value", 0.0),
+            ),
+        }
+        for state, properties in state_properties.items():
+            for gui_element, property_name, value in properties:
+                state.assignProperty(gui_element, property_name, value)
+
+            # An exposing time that is waiting to be displayed belongs to the state that was just
+            # exited, so it is dropped rather than written over the LCD that the new state has set
+            state.entered.connect(
+                self._exposing_time_timer.stop, Qt.ConnectionType.DirectConnection
             )
 
-        # Configure what happens when the states are entered and set the appropriate property values
-        # on various GUI elements
-
-        # "idle" state entered
-        state_idle.assignProperty(label_state, "text", "State: Idle")
-        state_idle.assignProperty(led_indicator_camera_exposing, "checked", False)
-        state_idle.assignProperty(button_start_exposure, "enabled", True)
-        state_idle.assignProperty(button_stop_exposure, "enabled", False)
-        state_idle.assignProperty(button_abort_exposure, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "value", 0.0)
-
-        # "camera_exposing" state entered
-        state_camera_exposing.assignProperty(label_state, "text", "State: Camera exposing")
-        state_camera_exposing.assignProperty(led_indicator_camera_exposing, "checked", True)
-        state_camera_exposing.assignProperty(button_start_exposure, "enabled", False)
-        state_camera_exposing.assignProperty(button_stop_exposure, "enabled", True)
-        state_camera_exposing.assignProperty(button_abort_exposure, "enabled", True)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "enabled", True)
-
-        # "saving_camera_images" state entered
-        state_saving_camera_images.assignProperty(
-            label_state, "text", "State: Saving camera images"
-        )
-        state_saving_camera_images.assignProperty(led_indicator_camera_exposing, "checked", False)
-        state_saving_camera_images.assignProperty(button_start_exposure, "enabled", False)
-        state_saving_camera_images.assignProperty(button_stop_exposure, "enabled", False)
-        state_saving_camera_images.assignProperty(button_abort_exposure, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "value", 0.0)
-
-        # "aborting camera exposure" state entered
-        state_aborting_camera_exposure.assignProperty(
-            label_state, "text", "State: Aborting camera exposure"
-        )
-        state_aborting_camera_exposure.assignProperty(
-            led_indicator_camera_exposing, "checked", False
-        )
-        state_aborting_camera_exposure.assignProperty(button_start_exposure, "enabled", False)
-        state_aborting_camera_exposure.assignProperty(button_stop_exposure, "enabled", False)
-        state_aborting_camera_exposure.assignProperty(button_abort_exposure, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "enabled", False)
-        state_idle.assignProperty(lcd_indicator_exposing_time, "value", 0.0)
-
         # Disable the user being able to resize the window by setting a fixed size
         self.setFixedWidth(500)
         self.setFixedHeight(200)
@@ -199,22 +235,35 @@ class MainWindow(QWidget):
         # Show the window
         self.show()
 
+    def _coalesce_exposing_time(self, exposing_time: float) -> None:
+        """Store the latest exposing time and schedule the LCD to be updated with it, unless an
+        update is already scheduled
+        """
+        self._pending_exposing_time = exposing_time
+        if not self._exposing_time_timer.isActive():
+            self._exposing_time_timer.start()
+
     def send_controller_message(self, message: ControllerMessage) -> None:
-        """Send the `asyncio` event loop's `AsyncInbox` a message by using the coroutine
-        `send_controller_message` and sending it to run on the `asyncio` event loop, putting
-        the message on the `AsyncInbox`.
+        """Send the `asyncio` event loop's `AsyncInbox` a message by scheduling the inbox's
+        `send` method to be called on the `asyncio` event loop, putting the message on the
+        `AsyncInbox`. The inbox is not thread-safe, so it must not be sent to directly.
         """
-        asyncio.run_coroutine_threadsafe(
-            coro=AsyncController.send_controller_message(inbox=self._async_inbox, message=message),
-            loop=self._asyncio_event_loop,
-        )
+        self._asyncio_event_loop.call_soon_threadsafe(self._async_inbox.send, message)
 
 
-def start_asyncio_event_loop(loop: asyncio.AbstractEventLoop) -> None:
-    """Starts the given `asyncio` loop on whatever the current thread is"""
+def start_asyncio_event_loop(
+    loop: asyncio.AbstractEventLoop, main: Coroutine[Any, Any, None]
+) -> None:
+    """Starts the given `asyncio` loop on whatever the current thread is and runs the given main
+    coroutine on it until the coroutine completes. The loop only keeps weak references to tasks
+    that are waiting, such as on an `asyncio.Event`, so running the main coroutine from this
+    thread keeps it, and the tasks it owns, referenced for as long as the loop runs. The loop's
+    debug mode slows down every callback and task step, so it is only enabled when the
+    `ASYNCIO_DEBUG` environment variable is set to a value other than "0".
+    """
     asyncio.set_event_loop(loop)
-    loop.set_debug(enabled=True)
-    loop.run_forever()
+    loop.set_debug(enabled=os.environ.get("ASYNCIO_DEBUG", "0") not in ("", "0"))
+    loop.run_until_complete(main)
 
 
 def run_event_loop(
@@ -224,11 +273,13 @@ def run_event_loop(
     to the event loop for any other thread to send messages to the event loop. The main
     coroutine that is launched on the event loop is `async_controller_main`.
     """
-    thread = Thread(target=start_asyncio_event_loop, args=(loop,), daemon=True)
+    thread = Thread(
+        target=start_asyncio_event_loop,
+        args=(loop, async_controller_main(inbox, signals)),
+        daemon=True,
+    )
     thread.start()
 
-    asyncio.run_coroutine_threadsafe(async_controller_main(inbox, signals), loop=loop)
-
 
 def run_application(application: QApplication):
     application.exec()
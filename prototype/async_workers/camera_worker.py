@@ -1,5 +1,5 @@
 # Core dependencies
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Any, final, override
 
 # Project dependencies
@@ -8,8 +8,10 @@ from prototype.async_core.worker import AsyncWorker
 from prototype.async_clients.camera_client import CameraClient
 
 
-class CameraMessage(Enum):
-    """Represents a message that can be sent to an `AsyncCameraWorker`"""
+class CameraMessage(IntEnum):
+    """Represents a message that can be sent to an `AsyncCameraWorker`. The messages are integers
+    so that they are hashed as integers when looked up in the worker's message handlers.
+    """
 
     START_EXPOSURE = auto()
     STOP_EXPOSURE = auto()
@@ -18,10 +20,22 @@ class CameraMessage(Enum):
 
 @final
 class AsyncCameraWorker(AsyncWorker[CameraMessage]):
+    __slots__ = ("__camera_client", "__message_handlers", "__synchronous_message_handlers")
+
     def __init__(self, ip_address: str, port: int) -> None:
         super().__init__(name="AsyncCameraWorker")
         self.__camera_client = CameraClient(ip_address, port)
 
+        # Bind the camera client's methods once rather than matching and resolving them for
+        # every message
+        self.__message_handlers = {
+            CameraMessage.START_EXPOSURE: self.__camera_client.start_exposure,
+            CameraMessage.STOP_EXPOSURE: self.__camera_client.stop_exposure,
+        }
+        self.__synchronous_message_handlers = {
+            CameraMessage.GET_EXPOSING_TIME: self.__camera_client.get_exposing_time,
+        }
+
     @override
     async def _initialize(self) -> None:
         await self.__camera_client.initialize()
@@ -32,16 +46,14 @@ class AsyncCameraWorker(AsyncWorker[CameraMessage]):
 
     @override
     async def _receive_message(self, message: CameraMessage) -> None:
-        match message:
-            case CameraMessage.START_EXPOSURE:
-                await self.__camera_client.start_exposure()
-            case CameraMessage.STOP_EXPOSURE:
-                await self.__camera_client.stop_exposure()
+        handler = self.__message_handlers.get(message)
+        if handler is not None:
+            await handler()
 
     @override
     async def _receive_synchronous_message(
         self, message: CameraMessage, reply_channel: ReplyChannel[Any]
     ) -> None:
-        match message:
-            case CameraMessage.GET_EXPOSING_TIME:
-                reply_channel.reply(await self.__camera_client.get_exposing_time())
+        handler = self.__synchronous_message_handlers.get(message)
+        if handler is not None:
+            reply_channel.reply(await handler())
@@ -1,10 +1,27 @@
 # Core dependencies
 import asyncio
+import logging
 import time
 from functools import partial
+from typing import Callable
+
+# Project dependencies
+# The server imports from the `prototype` package, so it is run from the repository's root
+# directory with `python -m prototype.camera_server`
+from prototype.event_loop import run_server
+from prototype.queue_logging import start_queue_logging
+
+
+_logger = logging.getLogger(__name__)
 
 
 class CameraServer:
+    # The states are encoded once, including their terminating newline, so that they can be sent
+    # as responses without being formatted and encoded on every request
+    _STATE_EXPOSING = b"exposing\n"
+    _STATE_IDLE = b"idle\n"
+    _STATE_UNKNOWN = b"unknown\n"
+
     def __init__(self) -> None:
         self.__exposure_start_time: float
         self.__exposing: bool = False
@@ -13,7 +30,7 @@ class CameraServer:
     def start_exposure(self) -> None:
         self.__exposing = True
         self.__idle = False
-        self.__exposure_start_time = time.time()
+        self.__exposure_start_time = time.monotonic()
 
     def stop_exposure(self) -> None:
         self.__exposing = False
@@ -21,50 +38,99 @@ class CameraServer:
 
     @property
     def get_exposing_time(self) -> float:
-        return time.time() - self.__exposure_start_time
+        return time.monotonic() - self.__exposure_start_time
 
     @property
-    def get_state(self) -> str:
+    def get_state(self) -> bytes:
         if self.__exposing:
-            return "exposing"
+            return self._STATE_EXPOSING
         elif self.__idle:
-            return "idle"
+            return self._STATE_IDLE
         else:
-            return "unknown"
+            return self._STATE_UNKNOWN
+
+
+def _start_exposure(camera_server: CameraServer) -> bytes:
+    camera_server.start_exposure()
+    return b"ok\n"
+
+
+def _stop_exposure(camera_server: CameraServer) -> bytes:
+    camera_server.stop_exposure()
+    return b"ok\n"
+
+
+def _get_exposing_time(camera_server: CameraServer) -> bytes:
+    return f"{camera_server.get_exposing_time}\n".encode()
+
+
+def _get_state(camera_server: CameraServer) -> bytes:
+    return camera_server.get_state
+
+
+# The handler for each command, keyed by the command's bytes so that a received command is looked
+# up without being decoded. Each handler returns the encoded response, including its newline.
+_COMMAND_HANDLERS: dict[bytes, Callable[[CameraServer], bytes]] = {
+    b"start_exposure": _start_exposure,
+    b"stop_exposure": _stop_exposure,
+    b"get_exposing_time": _get_exposing_time,
+    b"get_state": _get_state,
+}
+
+
+# The most bytes that are read from a connection at a time. All of the requests that are complete
+# in the bytes that are read are answered with a single drain of the writer, so this bounds how
+# many requests are batched together and thus how long the first of them waits for its response.
+READ_SIZE = 1024
 
 
 async def handle_echo(
     reader: asyncio.StreamReader, writer: asyncio.StreamWriter, camera_server: CameraServer
 ):
-    continue_listening = True
-
-    while continue_listening:
-        data = await reader.readline()
-        message: str = data.decode().strip()
-        addr = writer.get_extra_info("peername")
-
-        print(f"Received {message!r} from {addr!r}")
-
-        match message:
-            case "start_exposure":
-                camera_server.start_exposure()
-                response = "ok"
-            case "stop_exposure":
-                camera_server.stop_exposure()
-                response = "ok"
-            case "get_exposing_time":
-                response = str(camera_server.get_exposing_time)
-            case "get_state":
-                response = camera_server.get_state
-            case _:
-                response = ""
-                continue_listening = False
-
-        writer.write(f"{response}\n".encode())
+    addr = writer.get_extra_info("peername")
+
+    # The bytes of a request whose terminating newline has not been received yet
+    partial_request = b""
+
+    is_closing = False
+    while not is_closing:
+        # Reading returns whatever has been received, up to `READ_SIZE` bytes, so any requests
+        # that were sent back-to-back are read together without waiting for more of them
+        data = await reader.read(READ_SIZE)
+        if data:
+            *requests, partial_request = (partial_request + data).split(b"\n")
+            if not requests:
+                if len(partial_request) <= READ_SIZE:
+                    continue
+                # A request cannot be this long, so it is handled as an unknown command
+                requests = [partial_request]
+        else:
+            # The client closed the connection, so a partial request is handled as it is, and
+            # then the empty command that ends the connection is read
+            requests, partial_request = [partial_request], b""
+
+        responses = []
+        for request in requests:
+            command = request.strip()
+
+            _logger.debug("Received %r from %r", command, addr)
+
+            handler = _COMMAND_HANDLERS.get(command)
+            if handler is None:
+                # An unknown command, including the empty command read when the client closes the
+                # connection, is answered with an empty response and ends the connection
+                responses.append(b"\n")
+                is_closing = True
+                break
+
+            responses.append(handler(camera_server))
+
+        # The responses to all of the requests that were read are written together and drained once
+        writer.writelines(responses)
         await writer.drain()
 
     try:
-        print("Close the connection")
+        _logger.info("Close the connection from %r", addr)
         writer.close()
         await writer.wait_closed()
     except:
@@ -72,14 +138,22 @@ async def handle_echo(
 
 
 async def main():
+    # The per-request records are debug records, so unless `LOG_LEVEL` is set to "DEBUG", they
+    # are skipped without even being formatted
+    log_listener = start_queue_logging()
+
     bundled = partial(handle_echo, camera_server=CameraServer())
     server = await asyncio.start_server(bundled, "127.0.0.1", 8888)
 
     address = ", ".join(str(sock.getsockname()) for sock in server.sockets)
-    print(f"Serving on {address}")
+    _logger.info("Serving on %s", address)
 
-    async with server:
-        await server.serve_forever()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        log_listener.stop()
 
 
-asyncio.run(main())
+if __name__ == "__main__":
+    run_server(main())
@@ -0,0 +1,30 @@
+"""Provides the `asyncio` event loops that the prototype's GUI and servers run on"""
+
+# Core dependencies
+import asyncio
+from typing import Any, Coroutine
+
+# Package dependencies
+try:
+    # `uvloop` is not available on Windows, in which case the default `asyncio` event loop is used
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, which is a `uvloop` event loop when `uvloop` is available. Tasks
+    created on the loop start running eagerly, so a task whose coroutine completes without
+    suspending is never scheduled on the event loop.
+    """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def run_server(main: Coroutine[Any, Any, None]) -> None:
+    """Run the given main coroutine of a server on a new event loop from `new_event_loop` until
+    the coroutine completes
+    """
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        runner.run(main)
@@ -0,0 +1,31 @@
+"""Provides logging for `asyncio` applications that does not block the event loop on writing
+log records to the console
+"""
+
+# Core dependencies
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+from queue import SimpleQueue
+
+
+def start_queue_logging(level: int | str | None = None) -> QueueListener:
+    """Configure the root logger to put log records on a queue, which are then written to the
+    console by a background thread, so that logging never blocks the event loop. The `level`
+    defaults to the `LOG_LEVEL` environment variable, such as "DEBUG", or to "INFO" when it is not
+    set. The returned `QueueListener` is already started and should be stopped when the
+    application exits, so that any log records left on the queue are written.
+    """
+    if level is None:
+        level = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    log_listener = QueueListener(log_queue, log_handler)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    log_listener.start()
+    return log_listener
@@ -7,7 +7,7 @@ from hypothesis.strategies import one_of, text, integers, floats, tuples, none,
 import pytest
 
 # Project dependencies
-from prototype.async_core.messaging import AsyncInbox
+from prototype.async_core.messaging import AsyncInbox, OverflowPolicy
 
 
 @pytest.mark.asyncio
@@ -46,6 +46,103 @@ async def test_a_lot_of_messages(input_list):
     assert messages == input_list
 
 
+@pytest.mark.asyncio
+@given(lists(integers()))
+async def test_read_available(input_list):
+    """Verify that reading the available messages returns every queued up message
+    in order and leaves the inbox empty
+    """
+    inbox = AsyncInbox[int]()
+    for integer in input_list:
+        inbox.send(integer)
+    assert inbox.read_available() == input_list
+    assert inbox.read_available() == []
+
+
+@pytest.mark.asyncio
+@given(lists(integers(), min_size=1), integers(min_value=1, max_value=100))
+async def test_read_batch(input_list, max_count):
+    """Verify that reading a batch returns the queued up messages in order, at most
+    `max_count` at a time
+    """
+    inbox = AsyncInbox[int]()
+    for integer in input_list:
+        inbox.send(integer)
+    messages = []
+    while len(messages) < len(input_list):
+        batch = await inbox.read_batch(max_count)
+        assert 1 <= len(batch) <= max_count
+        messages.extend(batch)
+    assert messages == input_list
+
+
+@pytest.mark.asyncio
+@given(integers(min_value=1, max_value=100))
+async def test_sending_to_a_full_inbox(maxsize):
+    """Verify that sending a message to an inbox that is full raises `asyncio.QueueFull`
+    and that the inbox accepts messages again once a message is read
+    """
+    inbox = AsyncInbox[int](maxsize=maxsize)
+    for integer in range(maxsize):
+        inbox.send(integer)
+    with pytest.raises(asyncio.QueueFull):
+        inbox.send(maxsize)
+    assert await inbox.read() == 0
+    inbox.send(maxsize)
+    assert inbox.read_available() == list(range(1, maxsize + 1))
+
+
+@pytest.mark.asyncio
+@given(integers(min_value=1, max_value=100), lists(integers()))
+async def test_dropping_the_oldest_message(maxsize, input_list):
+    """Verify that sending a message to a full inbox that drops the oldest message
+    keeps the most recently sent messages
+    """
+    inbox = AsyncInbox[int](maxsize=maxsize, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    for integer in input_list:
+        inbox.send(integer)
+    assert inbox.read_available() == input_list[-maxsize:]
+
+
+@pytest.mark.asyncio
+@given(integers(min_value=1, max_value=100), lists(integers()))
+async def test_dropping_the_newest_message(maxsize, input_list):
+    """Verify that sending a message to a full inbox that drops the newest message
+    keeps the first sent messages
+    """
+    inbox = AsyncInbox[int](maxsize=maxsize, overflow_policy=OverflowPolicy.DROP_NEWEST)
+    for integer in input_list:
+        inbox.send(integer)
+    assert inbox.read_available() == input_list[:maxsize]
+
+
+@pytest.mark.asyncio
+async def test_dropping_the_oldest_synchronous_message():
+    """Verify that when a full inbox that drops the oldest message drops a synchronous message,
+    its sender is raised `asyncio.QueueFull` rather than waiting on a reply forever
+    """
+    inbox = AsyncInbox[int](maxsize=1, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    sender = asyncio.create_task(inbox.send_synchronous(1))
+    await asyncio.sleep(0)
+    inbox.send(2)
+    with pytest.raises(asyncio.QueueFull):
+        await asyncio.wait_for(sender, timeout=1)
+    assert inbox.read_available() == [2]
+
+
+@pytest.mark.asyncio
+async def test_reading_waits_for_a_message():
+    """Verify that reading an empty inbox waits until a message is sent"""
+
+    async def send_later(inbox: AsyncInbox[str]) -> None:
+        await asyncio.sleep(0.01)
+        inbox.send("test")
+
+    inbox = AsyncInbox[str]()
+    [message, _] = await asyncio.gather(inbox.read(), send_later(inbox))
+    assert message == "test"
+
+
 @pytest.mark.asyncio
 async def test_that_sending_synchronously_blocks():
     """Verify that sending a synchronous message to an inbox that is not
@@ -75,3 +172,21 @@ async def test_sending_a_synchronous_message():
     inbox = AsyncInbox[int]()
     [_, response] = await asyncio.gather(read_inbox(inbox), send_sync_message(inbox, 3))
     assert response == 6
+
+
+@pytest.mark.asyncio
+@given(lists(integers(), min_size=1, max_size=20))
+async def test_sending_several_synchronous_messages(input_list):
+    """Verify that every synchronous message sent one after another gets its own reply"""
+
+    async def read_inbox(inbox: AsyncInbox[int]) -> None:
+        for _ in input_list:
+            (x, reply_channel) = await inbox.read()
+            reply_channel.reply(2 * x)
+
+    async def send_sync_messages(inbox: AsyncInbox[int]) -> list[int]:
+        return [await inbox.send_synchronous(x) for x in input_list]
+
+    inbox = AsyncInbox[int]()
+    [_, responses] = await asyncio.gather(read_inbox(inbox), send_sync_messages(inbox))
+    assert responses == [2 * x for x in input_list]
@@ -0,0 +1,161 @@
+# Core dependencies
+import asyncio
+from typing import Any, override
+
+# Package dependencies
+import pytest
+
+# Project dependencies
+from prototype.async_core.messaging import ReplyChannel
+from prototype.async_core.worker import AsyncWorker, WorkerShutdownError
+
+
+class RecordingWorker(AsyncWorker[int]):
+    """A worker that records the messages it receives and replies to synchronous messages by
+    doubling them
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="RecordingWorker")
+        self.messages: list[int] = []
+        self.shutdown_count = 0
+
+    @override
+    async def _initialize(self) -> None:
+        pass
+
+    @override
+    async def _shutdown(self) -> None:
+        self.shutdown_count += 1
+
+    @override
+    async def _receive_message(self, message: int) -> None:
+        self.messages.append(message)
+
+    @override
+    async def _receive_synchronous_message(
+        self, message: int, reply_channel: ReplyChannel[Any]
+    ) -> None:
+        reply_channel.reply(2 * message)
+
+
+@pytest.mark.asyncio
+async def test_receiving_messages():
+    """Verify that the worker receives messages in the order they were sent"""
+    worker = RecordingWorker()
+    task = asyncio.create_task(worker.run())
+    for message in range(100):
+        worker.send(message)
+    assert await worker.send_synchronous(21) == 42
+    assert worker.messages == list(range(100))
+    worker.schedule_shutdown()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_scheduled_shutdown_interrupts_waiting_worker():
+    """Verify that scheduling a shutdown stops a worker that is waiting on an empty inbox and
+    that the worker is shut down exactly once without the cancellation propagating
+    """
+    worker = RecordingWorker()
+    task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0)
+    assert worker.is_initialized
+    worker.schedule_shutdown()
+    await asyncio.wait_for(task, timeout=1)
+    assert not task.cancelled()
+    assert worker.is_shutdown
+    assert worker.shutdown_count == 1
+
+
+class BlockingWorker(RecordingWorker):
+    """A worker that does not reply to synchronous messages until it is unblocked"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblock = asyncio.Event()
+
+    @override
+    async def _receive_synchronous_message(
+        self, message: int, reply_channel: ReplyChannel[Any]
+    ) -> None:
+        await self.unblock.wait()
+        reply_channel.reply(2 * message)
+
+
+@pytest.mark.asyncio
+async def test_scheduled_shutdown_releases_synchronous_senders():
+    """Verify that scheduling a shutdown while the worker is handling a batch of synchronous
+    messages raises `WorkerShutdownError` to the senders of every message that was not replied
+    to, including the one being handled and those still in the inbox
+    """
+    worker = BlockingWorker()
+    task = asyncio.create_task(worker.run())
+    senders = [asyncio.create_task(worker.send_synchronous(message)) for message in range(3)]
+    await asyncio.sleep(0)
+    senders.append(asyncio.create_task(worker.send_synchronous(3)))
+    await asyncio.sleep(0)
+    worker.schedule_shutdown()
+    await asyncio.wait_for(task, timeout=1)
+    results = await asyncio.wait_for(asyncio.gather(*senders, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, WorkerShutdownError) for result in results)
+    assert worker.shutdown_count == 1
+
+
+class SlowShutdownWorker(RecordingWorker):
+    """A worker whose shutdown does not finish until it is unblocked"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.shutting_down = asyncio.Event()
+        self.unblock = asyncio.Event()
+
+    @override
+    async def _shutdown(self) -> None:
+        self.shutting_down.set()
+        await self.unblock.wait()
+        await super()._shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scheduling_shutdown_twice():
+    """Verify that scheduling a shutdown a second time, both before the first is delivered and
+    while the worker is shutting down, does not cancel the worker's shutdown
+    """
+    worker = SlowShutdownWorker()
+    task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0)
+    worker.schedule_shutdown()
+    worker.schedule_shutdown()
+    await asyncio.wait_for(worker.shutting_down.wait(), timeout=1)
+    worker.schedule_shutdown()
+    worker.unblock.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert not task.cancelled()
+    assert task.cancelling() == 0
+    assert worker.is_shutdown
+    assert worker.shutdown_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_scheduled_before_running():
+    """Verify that a shutdown scheduled before the worker runs stops the worker"""
+    worker = RecordingWorker()
+    worker.schedule_shutdown()
+    await asyncio.wait_for(worker.run(), timeout=1)
+    assert worker.is_shutdown
+
+
+@pytest.mark.asyncio
+async def test_cancelled_worker_shuts_down():
+    """Verify that cancelling the worker's task from outside shuts down the worker and
+    propagates the cancellation
+    """
+    worker = RecordingWorker()
+    task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert worker.is_shutdown
+    assert worker.shutdown_count == 1
@@ -0,0 +1,87 @@
+# Core dependencies
+import asyncio
+from typing import Any
+
+# Package dependencies
+import pytest
+
+# Project dependencies
+from prototype.async_controller import (
+    AsyncController,
+    CameraExposing,
+    ControllerMessage,
+    StateId,
+    read_inbox,
+)
+from prototype.async_core.messaging import AsyncInbox
+from prototype.signals import Signals
+
+
+class RecordingSignal:
+    """Stands in for a Qt signal and records the arguments of every emit"""
+
+    def __init__(self) -> None:
+        self.emitted: list[tuple[Any, ...]] = []
+
+    def emit(self, *args: Any) -> None:
+        self.emitted.append(args)
+
+
+@pytest.mark.asyncio
+async def test_controller_emits(monkeypatch):
+    """Verify that repeated start messages are handled as one transition, that the exposing time
+    is only emitted when it changes, and that it is emitted again once a new exposure starts
+    """
+    # The camera worker is not run, so the exposing time is supplied by the test instead
+    exposing_time = 1.0
+
+    async def get_exposing_time(_state: CameraExposing) -> float:
+        return exposing_time
+
+    monkeypatch.setattr(CameraExposing, "get_exposing_time", get_exposing_time)
+
+    # Saving camera images is simulated by sleeping, which the test does not wait for
+    sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, "sleep", lambda _delay: sleep(0))
+
+    # Count how many times the controller handles a start, since a repeated start is also
+    # ignored by the camera exposing state
+    start_count = 0
+    start_camera_exposure = AsyncController.start_camera_exposure
+
+    async def count_start_camera_exposure(controller: AsyncController) -> None:
+        nonlocal start_count
+        start_count += 1
+        await start_camera_exposure(controller)
+
+    monkeypatch.setattr(AsyncController, "start_camera_exposure", count_start_camera_exposure)
+
+    signals = Signals(*(RecordingSignal() for _ in Signals._fields))
+    controller = AsyncController(initial_state=StateId.IDLE, signals=signals)
+
+    inbox = AsyncInbox[ControllerMessage]()
+    for _ in range(3):
+        inbox.send(ControllerMessage.START_CAMERA_EXPOSURE)
+    task = asyncio.create_task(read_inbox(inbox, controller))
+    await sleep(0)
+    task.cancel()
+    assert start_count == 1
+    assert signals.transition_to_camera_exposing.emitted == [()]
+    assert isinstance(controller.state, CameraExposing)
+
+    # The first exposing time is emitted, but the same exposing time, or one that changed by less
+    # than the epsilon, is not emitted again
+    assert await controller.get_exposing_time() == 1.0
+    assert await controller.get_exposing_time() == 1.0
+    exposing_time = 1.0001
+    await controller.get_exposing_time()
+    assert signals.set_exposing_time.emitted == [(1.0,)]
+
+    # After the exposure is stopped and a new one is started, the GUI has reset its exposing time,
+    # so the same exposing time is emitted again
+    exposing_time = 1.0
+    await controller.stop_camera_exposure()
+    assert signals.transition_to_idle.emitted == [()]
+    await controller.start_camera_exposure()
+    await controller.get_exposing_time()
+    assert signals.set_exposing_time.emitted == [(1.0,), (1.0,)]
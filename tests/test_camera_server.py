@@ -0,0 +1,103 @@
+# Core dependencies
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator
+
+# Package dependencies
+import pytest
+
+# Project dependencies
+from prototype.camera_server import READ_SIZE, CameraServer, handle_echo
+
+
+@asynccontextmanager
+async def connect_to_camera_server() -> (
+    AsyncIterator[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+):
+    """Serve a new camera on a free local port and open a connection to it"""
+    server = await asyncio.start_server(
+        partial(handle_echo, camera_server=CameraServer()), "127.0.0.1", 0
+    )
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            yield reader, writer
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+async def read_lines(reader: asyncio.StreamReader, count: int) -> list[bytes]:
+    """Read the given number of responses from the server"""
+    return [await asyncio.wait_for(reader.readline(), timeout=1) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_commands():
+    """Verify that commands that are sent together in a single write are each answered, in the
+    order they were sent
+    """
+    async with connect_to_camera_server() as (reader, writer):
+        writer.write(b"get_state\nstart_exposure\nget_state\nstop_exposure\nget_state\n")
+        await writer.drain()
+        assert await read_lines(reader, 5) == [
+            b"idle\n",
+            b"ok\n",
+            b"exposing\n",
+            b"ok\n",
+            b"idle\n",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_command_split_across_writes():
+    """Verify that a command whose bytes arrive in separate writes is answered once its newline
+    arrives
+    """
+    async with connect_to_camera_server() as (reader, writer):
+        writer.write(b"get_st")
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        writer.write(b"ate\nstart_")
+        await writer.drain()
+        await asyncio.sleep(0.05)
+        writer.write(b"exposure\n")
+        await writer.drain()
+        assert await read_lines(reader, 2) == [b"idle\n", b"ok\n"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_command_in_a_batch():
+    """Verify that an unknown command among pipelined commands is answered with an empty response
+    after the commands before it are answered, and that the server then closes the connection
+    without answering the commands after it
+    """
+    async with connect_to_camera_server() as (reader, writer):
+        writer.write(b"get_state\nstart_exposure\nunknown\nget_state\n")
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), timeout=1) == b"idle\nok\n\n"
+
+
+@pytest.mark.asyncio
+async def test_partial_command_at_end_of_file():
+    """Verify that when the client closes its side of the connection in the middle of a command,
+    the partial command is still answered before the server closes the connection
+    """
+    async with connect_to_camera_server() as (reader, writer):
+        writer.write(b"get_state\nget_state")
+        writer.write_eof()
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), timeout=1) == b"idle\nidle\n\n"
+
+
+@pytest.mark.asyncio
+async def test_line_longer_than_the_read_size():
+    """Verify that a line that is longer than `READ_SIZE` without a newline is answered as an
+    unknown command, which closes the connection, rather than being buffered without a bound
+    """
+    async with connect_to_camera_server() as (reader, writer):
+        writer.write(b"x" * (READ_SIZE + 1))
+        await writer.drain()
+        assert await asyncio.wait_for(reader.read(), timeout=1) == b"\n"